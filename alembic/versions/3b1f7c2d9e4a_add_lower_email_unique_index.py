@@ -0,0 +1,35 @@
+"""Add unique index on lower(email)
+
+Revision ID: 3b1f7c2d9e4a
+Revises: 5d3d4cf6ef67
+Create Date: 2024-08-20 21:14:03.518204
+
+Existing emails (users and login_attempts) are lowercased so the lowercased
+lookups can find them.
+Rows that differ only by case must be merged or removed before upgrading,
+otherwise the UPDATE / unique index fails. Find them with:
+
+    SELECT lower(email), count(*) FROM users
+    GROUP BY lower(email) HAVING count(*) > 1;
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b1f7c2d9e4a'
+down_revision: Union[str, None] = '5d3d4cf6ef67'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("UPDATE users SET email = lower(email)")
+    op.execute("UPDATE login_attempts SET email = lower(email)")
+    op.create_index('ix_users_email_lower', 'users', [sa.text('lower(email)')], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_users_email_lower', table_name='users')
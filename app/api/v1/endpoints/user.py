@@ -60,29 +60,31 @@ async def login_user(
     repo: UserRepository = Depends(get_user_repository),
     db: AsyncSession = Depends(get_async_db),
 ):
+    # 이메일은 소문자로 저장되므로 조회, 시도 횟수 제한 모두 같은 키를 쓴다
+    username = form_data.username.lower()
     try:
-        logger.info(f"Login attempt for user: {form_data.username}")
-        user = await repo.get_user_by_email(form_data.username)
+        logger.info(f"Login attempt for user: {username}")
+        user = await repo.get_user_by_email(username)
         if user is None:
-            logger.warning(f"User not found: {form_data.username}")
+            logger.warning(f"User not found: {username}")
             raise InvalidCredentialsError()
 
         if not verify_password(form_data.password, user.hashed_password):
-            logger.warning(f"Invalid password for user: {form_data.username}")
-            await check_brute_force(form_data.username, db)  # 여기로 이동
+            logger.warning(f"Invalid password for user: {username}")
+            await check_brute_force(username, db)  # 여기로 이동
             raise InvalidCredentialsError()
 
-        await clear_login_attempts(form_data.username, db)
+        await clear_login_attempts(username, db)
         access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
         access_token = create_access_token(
             data={"sub": user.email}, expires_delta=access_token_expires
         )
 
-        logger.info(f"Login successful for user: {form_data.username}")
+        logger.info(f"Login successful for user: {username}")
         return {"access_token": access_token, "token_type": "bearer"}
 
     except InvalidCredentialsError:
-        logger.warning(f"Login failed for user: {form_data.username}")
+        logger.warning(f"Login failed for user: {username}")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -6,11 +6,12 @@ class Settings(BaseSettings):
     PROJECT_NAME: str = "REsQue"
     API_V1_STR: str = "/api/v1"
     DATABASE_URL: str = "sqlite+aiosqlite:///./sql_app.db"
-    TEST_DATABASE_URL: str = "sqlite+aiosqlite:///./sql_app.db"
+    TEST_DATABASE_URL: str = "sqlite+aiosqlite:///:memory:"
     WELCOME_MESSAGE: str = "Hello, World!"
     SECRET_KEY: str = "your-secret-key"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
+    BCRYPT_ROUNDS: int = 12
     PROJECT_ROOT: str = str(Path(__file__).parents[2])
 
     model_config = SettingsConfigDict(env_file=".env")
@@ -9,7 +9,7 @@ from app.schemas.user import UserResponse
 from sqlalchemy.future import select
 from app.models import LoginAttempt
 import logging
-from sqlalchemy import delete
+from sqlalchemy import delete, func
 from jose import jwt, JWTError, ExpiredSignatureError
 from fastapi import HTTPException, status
 
@@ -22,7 +22,7 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
 def get_password_hash(password: str) -> str:
     password_bytes = password.encode("utf-8")
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
     hashed_bytes = bcrypt.hashpw(password_bytes, salt)
     return hashed_bytes.decode("utf-8")
 
@@ -101,15 +101,19 @@ def verify_token(token: str, credentials_exception):
 
 async def check_brute_force(email: str, db: AsyncSession):
     fifteen_minutes_ago = datetime.utcnow() - timedelta(minutes=15)
-    stmt = select(LoginAttempt).filter(
-        LoginAttempt.email == email, LoginAttempt.attempt_time > fifteen_minutes_ago
+    stmt = (
+        select(func.count())
+        .select_from(LoginAttempt)
+        .filter(
+            LoginAttempt.email == email,
+            LoginAttempt.attempt_time > fifteen_minutes_ago,
+        )
     )
-    result = await db.execute(stmt)
-    attempts = result.scalars().all()
+    attempt_count = await db.scalar(stmt)
 
-    logger.info(f"Login attempts for {email} in the last 15 minutes: {len(attempts)}")
+    logger.info(f"Login attempts for {email} in the last 15 minutes: {attempt_count}")
 
-    if len(attempts) >= 5:
+    if attempt_count >= 5:
         logger.warning(f"Brute force attempt detected for {email}")
         raise HTTPException(
             status_code=status.HTTP_429_TOO_MANY_REQUESTS,
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Column, Integer, String, Index, func
 from app.db.base import Base
 
 
@@ -9,3 +9,5 @@ class User(Base):
     email = Column(String, unique=True, index=True)
     name = Column(String)
     hashed_password = Column(String)
+
+    __table_args__ = (Index("ix_users_email_lower", func.lower(email), unique=True),)
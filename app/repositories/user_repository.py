@@ -7,18 +7,25 @@ from app.exceptions.user_exceptions import DuplicateEmailError, DatabaseError
 from app.core.security import get_password_hash
 
 
+def _is_unique_violation(error: IntegrityError) -> bool:
+    # PostgreSQL은 SQLSTATE 23505, SQLite는 메시지로만 구분된다
+    orig = error.orig
+    code = getattr(orig, "pgcode", None) or getattr(orig, "sqlstate", None)
+    if code is not None:
+        return code == "23505"
+    return "UNIQUE constraint failed" in str(orig)
+
+
 class UserRepository:
     def __init__(self, db_session: AsyncSession):
         self.db_session = db_session
 
     async def create_user(self, user_data: UserCreate) -> User:
         try:
-            if await self.check_user_existence(user_data.email):
-                raise DuplicateEmailError()
-
+            # 중복 검사는 lower(email) unique index가 담당
             hashed_password = get_password_hash(user_data.password)
             new_user = User(
-                email=user_data.email,
+                email=user_data.email.lower(),
                 hashed_password=hashed_password,
                 name=user_data.name,
             )
@@ -28,22 +35,17 @@ class UserRepository:
             await self.db_session.refresh(new_user)
 
             return new_user
-        except IntegrityError:
+        except IntegrityError as e:
             await self.db_session.rollback()
-            raise DatabaseError("An error occurred while accessing the database")
-        except DuplicateEmailError:
-            await self.db_session.rollback()
-            raise DuplicateEmailError("Email already exists")
+            if _is_unique_violation(e):
+                raise DuplicateEmailError("Email already exists")
+            raise DatabaseError(f"An unexpected error occurred: {str(e)}")
         except Exception as e:
             await self.db_session.rollback()
             raise DatabaseError(f"An unexpected error occurred: {str(e)}")
 
-    async def check_user_existence(self, email: str) -> bool:
-        email = email.lower()
-        result = await self.db_session.execute(select(User).filter(User.email == email))
-        return result.scalar_one_or_none() is not None
-
     async def get_user_by_email(self, email: str) -> User:
+        email = email.lower()
         result = await self.db_session.execute(select(User).filter(User.email == email))
         return result.scalar_one_or_none()
 
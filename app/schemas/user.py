@@ -2,6 +2,8 @@ import re
 from pydantic import BaseModel, EmailStr, Field, field_validator
 from app.utils.validator import validate_field
 
+NAME_PATTERN = re.compile(r"[a-zA-Z\s\'-]+")
+
 
 class UserCreate(BaseModel):
     email: EmailStr = Field(..., max_length=100)
@@ -35,7 +37,8 @@ class UserCreate(BaseModel):
 
     @staticmethod
     def name_characters(value: str) -> str:
-        if not re.match(r"^[a-zA-Z\s\'-]+$", value):
+        # 영문만 허용하므로 non-ASCII는 정규식 없이 바로 거른다
+        if not (value.isascii() and NAME_PATTERN.fullmatch(value)):
             raise ValueError(
                 "Name can only contain alphabets, spaces, hyphens, and apostrophes"
             )
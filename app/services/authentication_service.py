@@ -1,6 +1,6 @@
 from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete
+from sqlalchemy import select, delete, func
 from app.models import User, LoginAttempt
 from app.core.security import verify_password
 from app.exceptions.user_exceptions import (
@@ -23,23 +23,25 @@ class AuthenticationService:
         except ValidationError:
             raise InvalidCredentialsError("Invalid email or password format")
 
-        if not await self.check_login_attempts(user_login.email):
+        # 이메일은 소문자로 저장되므로 시도 기록도 같은 키를 쓴다
+        email = user_login.email.lower()
+        if not await self.check_login_attempts(email):
             raise TooManyAttemptsError(
                 "Too many login attempts. Please try again later."
             )
 
-        user = await self.get_user_by_email(user_login.email)
+        user = await self.get_user_by_email(email)
         if not user or not verify_password(user_login.password, user.hashed_password):
-            await self.record_failed_attempt(user_login.email)
+            await self.record_failed_attempt(email)
             raise InvalidCredentialsError("Invalid email or password")
 
-        await self.reset_login_attempts(user_login.email)
+        await self.reset_login_attempts(email)
         return user
 
     async def get_user_by_email(self, email: str) -> Optional[User]:
         try:
             result = await self.db_session.execute(
-                select(User).filter(User.email == email)
+                select(User).filter(User.email == email.lower())
             )
             return result.scalars().first()
         except Exception as e:
@@ -48,13 +50,13 @@ class AuthenticationService:
     async def check_login_attempts(self, email: str) -> bool:
         try:
             five_minutes_ago = datetime.utcnow() - timedelta(minutes=5)
-            result = await self.db_session.execute(
-                select(LoginAttempt)
+            attempt_count = await self.db_session.scalar(
+                select(func.count())
+                .select_from(LoginAttempt)
                 .filter(LoginAttempt.email == email)
                 .filter(LoginAttempt.attempt_time > five_minutes_ago)
             )
-            attempts = result.scalars().all()
-            return len(attempts) < 5
+            return attempt_count < 5
         except Exception as e:
             raise DatabaseError(f"Error checking login attempts: {str(e)}")
 
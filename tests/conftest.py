@@ -1,88 +1,184 @@
 import pytest
+from pytest_asyncio import is_async_test
+from sqlalchemy import event, insert
+from sqlalchemy.pool import StaticPool
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
 from app.db.base import Base, get_async_db
 from app.core.config import settings
-from httpx import AsyncClient
+from httpx import AsyncClient, ASGITransport
 from app.main import app
-from app.models import User
+from app.models import User, LoginAttempt
 from app.core.security import get_password_hash
-import uuid
+from datetime import datetime
 import ssl
 
 
+def pytest_collection_modifyitems(items):
+    # DB connection is shared for the whole session, so every async test
+    # has to run on the same event loop as the session fixtures.
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
 @pytest.fixture(scope="session")
 def engine():
-    engine = create_async_engine(settings.TEST_DATABASE_URL, echo=True, future=True)
+    engine_kwargs = {}
+    if settings.TEST_DATABASE_URL.endswith(":memory:"):
+        # in-memory DB lives only as long as its connection, so every
+        # checkout has to reuse the same one
+        engine_kwargs["poolclass"] = StaticPool
+        engine_kwargs["connect_args"] = {"check_same_thread": False}
+
+    engine = create_async_engine(
+        settings.TEST_DATABASE_URL, echo=True, future=True, **engine_kwargs
+    )
+
+    if engine.dialect.name == "sqlite":
+        # aiosqlite's implicit BEGIN handling breaks SAVEPOINT nesting,
+        # so turn it off and emit BEGIN ourselves.
+        @event.listens_for(engine.sync_engine, "connect")
+        def do_connect(dbapi_connection, connection_record):
+            dbapi_connection.isolation_level = None
+
+        @event.listens_for(engine.sync_engine, "begin")
+        def do_begin(conn):
+            conn.exec_driver_sql("BEGIN")
+
     yield engine
     engine.dispose()
 
 
-@pytest.fixture(scope="function")
-async def db_session(engine):
-    async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+@pytest.fixture(scope="session")
+async def connection(engine):
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
         await conn.run_sync(Base.metadata.create_all)
-    async with async_session() as session:
-        yield session
+    async with engine.connect() as conn:
+        yield conn
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
 
 
+def bind_session(connection) -> AsyncSession:
+    # commit()/rollback() inside the session only release/rollback a SAVEPOINT,
+    # the enclosing transaction is rolled back by the fixture.
+    return AsyncSession(
+        bind=connection,
+        join_transaction_mode="create_savepoint",
+        expire_on_commit=False,
+    )
+
+
+async def seed_users(session: AsyncSession, rows: list[dict]):
+    # 한 번의 INSERT로 여러 사용자를 넣는다 (hashed_password는 미리 계산된 값)
+    await session.execute(insert(User), rows)
+
+
+async def seed_failed_attempts(
+    session: AsyncSession, email: str, count: int, when: datetime | None = None
+):
+    # 실패한 로그인 시도를 한 번의 INSERT로 넣는다 (기본값은 현재 시각)
+    attempt_time = when or datetime.utcnow()
+    rows = [{"email": email, "attempt_time": attempt_time} for _ in range(count)]
+    await session.execute(insert(LoginAttempt), rows)
+
+
+@pytest.fixture(scope="class")
+async def class_db_session(connection):
+    transaction = await connection.begin()
+    async with bind_session(connection) as session:
+        yield session
+    await transaction.rollback()
+
+
 @pytest.fixture(scope="function")
-async def client(db_session: AsyncSession):
-    async def override_get_async_db():
-        try:
-            yield db_session
-        finally:
-            await db_session.close()
+async def db_session(connection):
+    if connection.in_transaction():
+        # data seeded by class_db_session stays visible to the test
+        transaction = await connection.begin_nested()
+    else:
+        transaction = await connection.begin()
+    async with bind_session(connection) as session:
+        yield session
+    await transaction.rollback()
 
-    app.dependency_overrides[get_async_db] = override_get_async_db
 
-    base_url = "http://test"
-    async with AsyncClient(app=app, base_url=base_url) as ac:
+@pytest.fixture(scope="session")
+async def async_client():
+    # 세션 전체에서 하나의 클라이언트를 재사용한다.
+    # DB에 접근하는 테스트는 override를 걸어주는 client 픽스처를 사용할 것
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as ac:
         yield ac
 
-    app.dependency_overrides.clear()
-
 
 @pytest.fixture(scope="function")
-async def httpsclient(db_session: AsyncSession):
+async def client(async_client: AsyncClient, db_session: AsyncSession):
+    # 세션 수명은 db_session 픽스처가 관리한다 (close하면 SAVEPOINT가 롤백된다)
     async def override_get_async_db():
-        try:
-            yield db_session
-        finally:
-            await db_session.close()
+        yield db_session
 
     app.dependency_overrides[get_async_db] = override_get_async_db
+    yield async_client
+    app.dependency_overrides.clear()
+
 
+@pytest.fixture(scope="session")
+async def async_https_client():
+    # ASGITransport는 실제 TLS 핸드셰이크를 하지 않으므로 세션 당 하나로 충분하다
     ssl_context = ssl.create_default_context()
     ssl_context.check_hostname = False
     ssl_context.verify_mode = ssl.CERT_NONE
 
     base_url = "https://test"
     async with AsyncClient(
-        app=app, base_url=base_url, verify=ssl_context, follow_redirects=True
+        transport=ASGITransport(app=app),
+        base_url=base_url,
+        verify=ssl_context,
+        follow_redirects=True,
     ) as ac:
         yield ac
 
+
+@pytest.fixture(scope="function")
+async def httpsclient(async_https_client: AsyncClient, db_session: AsyncSession):
+    # 세션 수명은 db_session 픽스처가 관리한다 (close하면 SAVEPOINT가 롤백된다)
+    async def override_get_async_db():
+        yield db_session
+
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    yield async_https_client
     app.dependency_overrides.clear()
 
 
-@pytest.fixture
-def unique_email():
-    return f"test_{uuid.uuid4()}@example.com"
+@pytest.fixture(scope="session", autouse=True)
+def fast_password_hashing():
+    # bcrypt 최소 cost로 해싱. 실제 cost가 필요한 테스트는 realhash 마커를 붙인다
+    production_rounds = settings.BCRYPT_ROUNDS
+    settings.BCRYPT_ROUNDS = 4
+    yield production_rounds
+    settings.BCRYPT_ROUNDS = production_rounds
 
 
-@pytest.fixture
-async def test_user(db_session: AsyncSession, unique_email):
-    user = User(
-        email=unique_email,
-        hashed_password=get_password_hash("securePassword123!"),
-        name="Test User",  # Change full_name to name if that's what your User model uses
-    )
-    db_session.add(user)
-    await db_session.commit()
-    await db_session.refresh(user)
-    return user
+@pytest.fixture(autouse=True)
+def real_password_hashing(request, monkeypatch, fast_password_hashing):
+    if request.node.get_closest_marker("realhash"):
+        monkeypatch.setattr(settings, "BCRYPT_ROUNDS", fast_password_hashing)
+
+
+@pytest.fixture(scope="session")
+def hashed_valid_password():
+    return get_password_hash("SecurePass123!")
+
+
+@pytest.fixture(scope="session")
+def hashed_secure_password():
+    return get_password_hash("securePassword123!")
+
+
+@pytest.fixture(scope="session")
+def hashed_correct_password():
+    return get_password_hash("correctPassword123!")
@@ -0,0 +1,29 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+from tests.conftest import seed_users
+
+
+EXISTING_EMAIL = "existing@example.com"
+EXISTING_NAME = "John Doe"
+EXISTING_PASSWORD = "ValidPass1!"
+
+
+@pytest.fixture(scope="class")
+async def existing_user(request, class_db_session: AsyncSession):
+    # 클래스 당 한 번만 추가되고, 클래스가 끝나면 롤백된다.
+    # 테스트 클래스는 SEED_USER(email, name)와 SEED_PASSWORD_HASH(해시 픽스처 이름)로
+    # 시드할 사용자를 바꿀 수 있다
+    seed = getattr(request.cls, "SEED_USER", None)
+    if seed is None:
+        user = {
+            "email": EXISTING_EMAIL,
+            "name": EXISTING_NAME,
+            "hashed_password": "hashed_" + EXISTING_PASSWORD,
+        }
+    else:
+        user = {
+            **seed,
+            "hashed_password": request.getfixturevalue(request.cls.SEED_PASSWORD_HASH),
+        }
+    await seed_users(class_db_session, [user])
+    yield user
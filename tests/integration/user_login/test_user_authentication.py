@@ -1,71 +1,64 @@
 import pytest
-from sqlalchemy import select
-from app.models import User
+from unittest.mock import patch
 from app.core.security import get_password_hash, verify_password
 from app.services.authentication_service import AuthenticationService
 from app.exceptions.user_exceptions import InvalidCredentialsError, TooManyAttemptsError
-from app.schemas.user import UserLogin
+from app.schemas.user import UserCreate
+from app.repositories.user_repository import UserRepository
 
 
-@pytest.mark.asyncio
 @pytest.mark.unit
 @pytest.mark.req_2_user_login
+@pytest.mark.usefixtures("existing_user")
 class TestUserAuthentication:
+    SEED_USER = {"email": "test@example.com", "name": "Test User"}
+    SEED_PASSWORD_HASH = "hashed_correct_password"
+
     @pytest.fixture(autouse=True)
-    async def setup(self, db_session):
+    def setup(self, db_session):
         self.db_session = db_session
         self.auth_service = AuthenticationService(db_session)
 
-        # Create a test user
-        test_user = User(
-            email="test@example.com",
-            name="Test User",
-            hashed_password=get_password_hash("correctPassword123!"),
+    async def test_successful_login(self):
+        user = await self.auth_service.authenticate_user(
+            "test@example.com", "correctPassword123!"
         )
-        self.db_session.add(test_user)
-        await self.db_session.commit()
-
-        yield
+        assert user is not None
+        assert user.email == "test@example.com"
 
-        # Clean up
-        await self.db_session.execute(
-            select(User).where(User.email == "test@example.com")
+    async def test_login_with_mixed_case_email(self):
+        # 저장된 이메일은 소문자이므로 입력 대소문자와 관계없이 로그인된다
+        await UserRepository(self.db_session).create_user(
+            UserCreate(
+                email="Mixed@Example.com", password="correctPassword123!", name="Mixed"
+            )
         )
-        await self.db_session.commit()
 
-    async def test_successful_login(self):
-        user_login = UserLogin(email="test@example.com", password="correctPassword123!")
         user = await self.auth_service.authenticate_user(
-            user_login.email, user_login.password
+            "Mixed@Example.com", "correctPassword123!"
         )
-        assert user is not None
-        assert user.email == "test@example.com"
+        assert user.email == "mixed@example.com"
 
     async def test_failed_login_wrong_password(self):
-        user_login = UserLogin(email="test@example.com", password="wrongPassword123!")
         with pytest.raises(InvalidCredentialsError):
             await self.auth_service.authenticate_user(
-                user_login.email, user_login.password
+                "test@example.com", "wrongPassword123!"
             )
 
     async def test_failed_login_non_existent_user(self):
-        user_login = UserLogin(
-            email="nonexistent@example.com", password="somePassword123!"
-        )
         with pytest.raises(InvalidCredentialsError):
             await self.auth_service.authenticate_user(
-                user_login.email, user_login.password
+                "nonexistent@example.com", "somePassword123!"
             )
 
-    async def test_login_attempt_limit(self, mocker):
-        mocker.patch.object(
+    async def test_login_attempt_limit(self):
+        with patch.object(
             AuthenticationService, "check_login_attempts", return_value=False
-        )
-        user_login = UserLogin(email="test@example.com", password="correctPassword123!")
-        with pytest.raises(TooManyAttemptsError):
-            await self.auth_service.authenticate_user(
-                user_login.email, user_login.password
-            )
+        ):
+            with pytest.raises(TooManyAttemptsError):
+                await self.auth_service.authenticate_user(
+                    "test@example.com", "correctPassword123!"
+                )
 
     @pytest.mark.parametrize(
         "email,password,expected_error",
@@ -79,7 +72,7 @@ class TestUserAuthentication:
         with pytest.raises(expected_error):
             await self.auth_service.authenticate_user(email=email, password=password)
 
-    async def test_password_hashing_and_verification(self):
+    def test_password_hashing_and_verification(self):
         password = "testPassword123!"
         hashed_password = get_password_hash(password)
         assert verify_password(password, hashed_password)
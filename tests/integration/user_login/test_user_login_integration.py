@@ -1,23 +1,68 @@
 import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, func
 from jose import jwt
-from datetime import timedelta
-import asyncio
+from datetime import datetime, timedelta, timezone
 
 from app.main import app
-from app.core.security import get_password_hash, verify_password, create_access_token
-from app.models import User, LoginAttempt
+from app.db.base import get_async_db
+from app.core.security import verify_password, create_access_token
+from app.models import LoginAttempt
 from app.services.authentication_service import AuthenticationService
 from app.core.config import settings
-from freezegun import freeze_time
+from time_machine import travel
+from tests.conftest import seed_users, seed_failed_attempts
 
 
-@pytest.mark.asyncio
+TEST_USER = {"email": "test@example.com", "password": "securePassword123!"}
+LOGIN_FORM = {"username": TEST_USER["email"], "password": TEST_USER["password"]}
+FORM_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+JWT_ALGORITHMS = [settings.ALGORITHM]
+
+
+@pytest.fixture
+def frozen_clock():
+    start = datetime(2023, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+    with travel(start, tick=False) as frozen:
+        yield frozen
+
+
+@pytest.mark.usefixtures("existing_user")
 class TestLoginIntegration:
     LOGIN_URL = "/api/v1/users/login"
     ME_URL = "/api/v1/users/me"
+    SEED_USER = {"email": TEST_USER["email"], "name": "Test User"}
+    SEED_PASSWORD_HASH = "hashed_secure_password"
+
+    @pytest.fixture(scope="class")
+    async def logged_in_token(
+        self, async_client: AsyncClient, class_db_session: AsyncSession, existing_user
+    ):
+        # Log in once per class; tests that only need a valid token reuse it.
+        async def override_get_async_db():
+            yield class_db_session
+
+        app.dependency_overrides[get_async_db] = override_get_async_db
+        try:
+            response = await async_client.post(
+                self.LOGIN_URL,
+                data=LOGIN_FORM,
+                headers=FORM_HEADERS,
+            )
+        finally:
+            app.dependency_overrides.clear()
+
+        assert response.status_code == 200, f"Login failed: {response.content}"
+        data = response.json()
+        token = data["access_token"]
+        return {
+            "token": token,
+            "token_type": data["token_type"],
+            "payload": jwt.decode(
+                token, settings.SECRET_KEY, algorithms=JWT_ALGORITHMS
+            ),
+        }
 
     @pytest.fixture(autouse=True)
     async def setup(self, client: AsyncClient, db_session: AsyncSession):
@@ -25,187 +70,141 @@ class TestLoginIntegration:
         self.db_session = db_session
         self.auth_service = AuthenticationService(db_session)
 
-        test_user_data = self.get_test_user_data()
-
-        hashed_password = get_password_hash(password=test_user_data["password"])
-        test_user = User(email=test_user_data["email"], hashed_password=hashed_password)
-        self.db_session.add(test_user)
-        await self.db_session.commit()
+    def test_login_success(self, logged_in_token):
+        assert logged_in_token["token_type"] == "bearer"
+        assert logged_in_token["payload"]["sub"] == TEST_USER["email"]
 
-        # Verify the user was created
-        result = await self.db_session.execute(
-            select(User).filter(User.email == test_user_data["email"])
+    async def test_login_failure(self):
+        response = await self.client.post(
+            self.LOGIN_URL,
+            data={"username": TEST_USER["email"], "password": "wrongPassword"},
+            headers=FORM_HEADERS,
         )
-        created_user = result.scalar_one_or_none()
-        assert created_user is not None, f"Test user was not created: {test_user_data["email"]}"
-        print(f"Test user created: {created_user.email}")
-
-        yield
-
-        # Cleanup
-        await self.db_session.execute(User.__table__.delete())
-        await self.db_session.execute(LoginAttempt.__table__.delete())
-        await self.db_session.commit()
+        assert response.status_code == 401
+        assert response.json()["detail"] == "Incorrect email or password"
 
-    def get_test_user_data(self):
-        return {
-            "email": "test@example.com",
-            "password": "securePassword123!",
-        }
+    @pytest.mark.parametrize(
+        "password, expected",
+        [(TEST_USER["password"], True), ("wrongPassword", False)],
+    )
+    def test_verify_password(self, hashed_secure_password, password, expected):
+        assert verify_password(password, hashed_secure_password) is expected
 
-    def get_test_user_request(self):
-        data = self.get_test_user_data()
+    async def test_protected_route(self, logged_in_token):
+        response = await self.client.get(
+            self.ME_URL,
+            headers={"Authorization": f"Bearer {logged_in_token['token']}"},
+        )
+        assert response.status_code == 200, f"Protected route failed: {response.content}"
+        assert response.json()["email"] == TEST_USER["email"]
+
+    async def test_seeded_user_survives_across_requests(self, hashed_secure_password):
+        # 커밋하지 않은 시드 데이터는 429 응답(커밋 없음) 뒤에도 남아 있어야 한다
+        email = "other@example.com"
+        await seed_users(
+            self.db_session,
+            [
+                {
+                    "email": email,
+                    "name": "Other",
+                    "hashed_password": hashed_secure_password,
+                }
+            ],
+        )
+        await seed_failed_attempts(self.db_session, email, 5)
 
-        return {
-            "username": data["email"],
-            "password": data["password"],
-        }
+        response = await self.client.post(
+            self.LOGIN_URL,
+            data={"username": email, "password": "wrongPassword"},
+            headers=FORM_HEADERS,
+        )
+        assert response.status_code == 429
 
-    async def test_login_success(self):
         response = await self.client.post(
             self.LOGIN_URL,
-            data=self.get_test_user_request(),
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
+            data={"username": email, "password": TEST_USER["password"]},
+            headers=FORM_HEADERS,
         )
         assert response.status_code == 200
-        data = response.json()
-        assert "access_token" in data
-        assert "token_type" in data
-        assert data["token_type"] == "bearer"
 
-        # Verify JWT token
-        token = data["access_token"]
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
+    async def test_https_secure_connection(self, httpsclient: AsyncClient):
+        response = await httpsclient.post(
+            self.LOGIN_URL,
+            data=LOGIN_FORM,
+            headers=FORM_HEADERS,
         )
-        assert payload["sub"] == "test@example.com"
+        assert str(response.url).startswith("https://")
+        assert response.status_code == 200
 
-    async def test_login_failure(self):
+    async def test_brute_force_prevention(self, frozen_clock):
+        # Seed 4 earlier failed attempts for the class-seeded user (rolled back per test)
+        await seed_failed_attempts(self.db_session, TEST_USER["email"], 4)
+
+        # The 5th attempt with wrong password is still rejected normally
         response = await self.client.post(
             self.LOGIN_URL,
-            data={"username": self.get_test_user_data()["email"], "password": "wrongPassword"},
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
+            data={"username": TEST_USER["email"], "password": "wrongPassword"},
+            headers=FORM_HEADERS,
         )
         assert response.status_code == 401
-        assert response.json()["detail"] == "Incorrect email or password"
 
-    async def test_password_hashing_and_verification(self):
-        password = "securePassword123!"
-        hashed_password = get_password_hash(password)
-        assert verify_password(
-            password, hashed_password
-        ), "Password verification failed"
-        assert not verify_password(
-            "wrongpassword", hashed_password
-        ), "Incorrect password was verified"
-
-    async def test_protected_route(self):
-        # First, login to get the token
-        login_response = await self.client.post(
+        # The 6th attempt should be blocked
+        response = await self.client.post(
             self.LOGIN_URL,
-            data=self.get_test_user_request(),
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
+            data={"username": TEST_USER["email"], "password": "wrongPassword"},
+            headers=FORM_HEADERS,
         )
-        print(f"Login response status: {login_response.status_code}")
-        print(f"Login response content: {login_response.content}")
+        assert response.status_code == 429
+        assert "Too many login attempts" in response.json()["detail"]
 
-        if login_response.status_code != 200:
-            # Get more details about the user in the database
-            result = await self.db_session.execute(
-                select(User).filter(User.email == "test123456@example.com")
-            )
-            user = result.scalar_one_or_none()
-            if user:
-                print(f"User exists in DB: {user.email}")
-                print(f"Stored hashed password: {user.hashed_password}")
-            else:
-                print("User does not exist in the database")
-
-        assert (
-            login_response.status_code == 200
-        ), f"Login failed: {login_response.content}"
-
-    async def test_password_hashing_comparison(self):
-        password = "securePassword123!"
-        hashed_password = get_password_hash(password)
-
-        assert verify_password(password, hashed_password)
-        assert not verify_password("wrongPassword", hashed_password)
-        
-    async def test_https_secure_connection(self, httpsclient: AsyncClient):
-        data = self.get_test_user_request()
-        response = await httpsclient.post(
+        # Move time forward by 15 minutes
+        frozen_clock.shift(timedelta(minutes=15, seconds=1))
+
+        # Now the login should work with correct password
+        response = await self.client.post(
             self.LOGIN_URL,
-            data=data,
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
+            data=LOGIN_FORM,
+            headers=FORM_HEADERS,
         )
-        assert str(response.url).startswith("https://")
         assert response.status_code == 200
 
-    async def test_brute_force_prevention(self, client: AsyncClient, test_user: User):
-        with freeze_time("2023-01-01 12:00:00"):
-            # Attempt to login 5 times with wrong password
-            for _ in range(5):
-                response = await client.post(
-                    self.LOGIN_URL,
-                    data={"username": test_user.email, "password": "wrongPassword"},
-                    headers={"Content-Type": "application/x-www-form-urlencoded"},
-                )
-                assert response.status_code == 401
-
-            # The 6th attempt should be blocked
-            response = await client.post(
-                self.LOGIN_URL,
-                data={"username": test_user.email, "password": "wrongPassword"},
-                headers={"Content-Type": "application/x-www-form-urlencoded"},
-            )
-            assert response.status_code == 429
-            assert "Too many login attempts" in response.json()["detail"]
+    async def test_brute_force_prevention_ignores_email_case(self):
+        # 대소문자만 다른 이메일도 같은 시도 횟수를 공유해야 한다
+        await seed_failed_attempts(self.db_session, TEST_USER["email"], 5)
 
-        # Move time forward by 15 minutes
-        with freeze_time("2023-01-01 12:15:01"):
-            # Now the login should work with correct password
-            response = await client.post(
-                self.LOGIN_URL,
-                data={"username": test_user.email, "password": "securePassword123!"},
-                headers={"Content-Type": "application/x-www-form-urlencoded"},
-            )
-            assert response.status_code == 200
+        response = await self.client.post(
+            self.LOGIN_URL,
+            data={"username": TEST_USER["email"].title(), "password": "wrongPassword"},
+            headers=FORM_HEADERS,
+        )
+        assert response.status_code == 429
 
     async def test_login_attempts_reset_after_successful_login(self):
-        # Attempt to login 4 times with wrong password
-        for _ in range(4):
-            response = await self.client.post(
-                self.LOGIN_URL,
-                data={"username": "test@example.com", "password": "wrongPassword"},
-                headers={"Content-Type": "application/x-www-form-urlencoded"},
-            )
-            assert response.status_code == 401
+        # 4 failed attempts before the successful login
+        await seed_failed_attempts(self.db_session, TEST_USER["email"], 4)
 
         # Login successfully
         response = await self.client.post(
             self.LOGIN_URL,
-            data={"username": "test@example.com", "password": "securePassword123!"},
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
+            data=LOGIN_FORM,
+            headers=FORM_HEADERS,
         )
         assert response.status_code == 200
 
         # Check that login attempts have been reset
         result = await self.db_session.execute(
-            select(LoginAttempt).filter(LoginAttempt.email == "test@example.com")
+            select(func.count())
+            .select_from(LoginAttempt)
+            .where(LoginAttempt.email == TEST_USER["email"])
         )
-        attempts = result.scalars().all()
-        assert len(attempts) == 0
+        assert result.scalar_one() == 0
 
     async def test_token_expiration(self):
-        # Create a short-lived token
+        # Create a token that is already expired
         access_token = create_access_token(
-            data={"sub": "test@example.com"}, expires_delta=timedelta(seconds=1)
+            data={"sub": TEST_USER["email"]}, expires_delta=timedelta(seconds=-1)
         )
 
-        # Wait for the token to expire
-        await asyncio.sleep(2)
-
         # Try to access a protected route with the expired token
         response = await self.client.get(
             self.ME_URL, headers={"Authorization": f"Bearer {access_token}"}
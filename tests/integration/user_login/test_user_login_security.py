@@ -1,56 +1,50 @@
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from app.core.security import get_password_hash, verify_password
-from app.models import User, LoginAttempt
+from sqlalchemy import select, func
+from app.core.security import verify_password
+from app.models import LoginAttempt
 from app.services.authentication_service import AuthenticationService
-from app.exceptions.user_exceptions import TooManyAttemptsError, InvalidCredentialsError
-from freezegun import freeze_time
+from app.exceptions.user_exceptions import TooManyAttemptsError
+from time_machine import travel
 from httpx import AsyncClient
+from tests.conftest import seed_failed_attempts
+from datetime import datetime, timedelta, timezone
 
 
-@pytest.mark.asyncio
+# login_attempts stores naive UTC timestamps (datetime.utcnow())
+T0 = datetime(2023, 1, 1, 12, 0, 0)
+T5 = T0 + timedelta(minutes=5, seconds=1)
+# time_machine treats naive datetimes as local time, so travel with explicit UTC
+UTC = timezone.utc
+
+
+@pytest.mark.usefixtures("existing_user")
 class TestLoginSecurity:
+    SEED_USER = {"email": "test@example.com", "name": "Test User"}
+    SEED_PASSWORD_HASH = "hashed_secure_password"
+
     @pytest.fixture(autouse=True)
     async def setup(self, client: TestClient, db_session: AsyncSession):
         self.client = client
         self.db_session = db_session
         self.auth_service = AuthenticationService(db_session)
 
-        # Create a test user
-        hashed_password = get_password_hash("securePassword123!")
-        test_user = User(email="test@example.com", hashed_password=hashed_password)
-        self.db_session.add(test_user)
-        await self.db_session.commit()
-
-        yield
-
-        # Cleanup
-        await self.db_session.execute(User.__table__.delete())
-        await self.db_session.execute(LoginAttempt.__table__.delete())
-        await self.db_session.commit()
-
-    async def test_password_hashing_comparison(self):
+    def test_password_hashing_comparison(self, hashed_secure_password):
         password = "securePassword123!"
-        hashed_password = get_password_hash(password)
 
-        assert verify_password(password, hashed_password)
-        assert not verify_password("wrongPassword", hashed_password)
+        assert verify_password(password, hashed_secure_password)
+        assert not verify_password("wrongPassword", hashed_secure_password)
 
     async def test_https_secure_connection(self, httpsclient: AsyncClient):
         response = await httpsclient.get("/api/v1")
         assert str(response.url).startswith("https://")
         assert response.status_code == 200
 
-    @freeze_time("2023-01-01 12:00:00")
+    @travel(T0.replace(tzinfo=UTC), tick=False)
     async def test_brute_force_prevention(self):
-        # Attempt to login 5 times with wrong password
-        for _ in range(5):
-            with pytest.raises(InvalidCredentialsError):
-                await self.auth_service.authenticate_user(
-                    "test@example.com", "wrongPassword"
-                )
+        # 5 failed attempts within the window, seeded with a single INSERT
+        await seed_failed_attempts(self.db_session, "test@example.com", 5, when=T0)
 
         # The 6th attempt should raise TooManyAttemptsError
         with pytest.raises(TooManyAttemptsError):
@@ -59,7 +53,7 @@ class TestLoginSecurity:
             )
 
         # Move time forward by 5 minutes
-        with freeze_time("2023-01-01 12:05:01"):
+        with travel(T5.replace(tzinfo=UTC), tick=False):
             # Now the login should work with correct password
             user = await self.auth_service.authenticate_user(
                 "test@example.com", "securePassword123!"
@@ -68,12 +62,8 @@ class TestLoginSecurity:
             assert user.email == "test@example.com"
 
     async def test_login_attempts_reset_after_successful_login(self):
-        # Attempt to login 4 times with wrong password
-        for _ in range(4):
-            with pytest.raises(InvalidCredentialsError):
-                await self.auth_service.authenticate_user(
-                    "test@example.com", "wrongPassword"
-                )
+        # 4 failed attempts before the successful login
+        await seed_failed_attempts(self.db_session, "test@example.com", 4)
 
         # Login successfully
         user = await self.auth_service.authenticate_user(
@@ -83,7 +73,8 @@ class TestLoginSecurity:
 
         # Check that login attempts have been reset
         result = await self.db_session.execute(
-            select(LoginAttempt).filter(LoginAttempt.email == "test@example.com")
+            select(func.count())
+            .select_from(LoginAttempt)
+            .where(LoginAttempt.email == "test@example.com")
         )
-        attempts = result.scalars().all()
-        assert len(attempts) == 0
+        assert result.scalar_one() == 0
@@ -1,65 +1,54 @@
+from types import MappingProxyType
 import pytest
-from sqlalchemy import select, delete
+from sqlalchemy import inspect
+from sqlalchemy.exc import IntegrityError
 from app.schemas.user import UserCreate
-from app.models.user import User
 from app.repositories.user_repository import UserRepository
 from app.exceptions.user_exceptions import DuplicateEmailError, DatabaseError
+from tests.integration.conftest import EXISTING_EMAIL, EXISTING_NAME, EXISTING_PASSWORD
+
+
+EMAILS = {
+    "unique": "new@example.com",
+    "existing": EXISTING_EMAIL,
+    "case_insensitive": EXISTING_EMAIL.upper(),
+}
+PASSWORDS = {
+    "valid": EXISTING_PASSWORD,
+}
+NAMES = {
+    "valid": EXISTING_NAME,
+}
+
+
+VALID_DATA = MappingProxyType(
+    {
+        "email": EMAILS["unique"],
+        "password": PASSWORDS["valid"],
+        "name": NAMES["valid"],
+    }
+)
 
 
 @pytest.mark.asyncio
 @pytest.mark.integration
 @pytest.mark.req_1_basic_user_registration
+@pytest.mark.usefixtures("existing_user")
 class TestUserRegistrationDuplication:
-    @classmethod
-    def setup_class(cls):
-        cls.emails = {
-            "unique": "new@example.com",
-            "existing": "existing@example.com",
-            "case_insensitive": "EXISTING@example.com",
-        }
-        cls.passwords = {
-            "valid": "ValidPass1!",
-        }
-        cls.names = {
-            "valid": "John Doe",
-        }
-
-    @classmethod
-    def get_valid_data(cls):
-        return {
-            "email": cls.emails["unique"],
-            "password": cls.passwords["valid"],
-            "name": cls.names["valid"],
-        }
-
     @pytest.fixture(autouse=True)
-    async def setup(self, db_session):
-        # 테스트 실행 전 데이터베이스 정리
-        await db_session.execute(delete(User))
-        await db_session.commit()
-
+    def setup(self, db_session):
         self.user_repository = UserRepository(db_session)
 
-        # 기존 사용자 추가
-        existing_user = User(
-            email=self.emails["existing"],
-            name=self.names["valid"],
-            hashed_password="hashed_" + self.passwords["valid"],
-        )
-        db_session.add(existing_user)
-        await db_session.commit()  # flush 대신 commit 사용
-
     async def test_register_user_with_unique_email(self):
-        data = self.get_valid_data()
+        data = VALID_DATA
         user = await self.user_repository.create_user(UserCreate(**data))
 
         assert user is not None
         assert user.email == data["email"]
-        assert await self.user_repository.get_user_by_email(data["email"]) is not None
+        assert inspect(user).persistent
 
     async def test_register_user_with_duplicate_email(self):
-        data = self.get_valid_data()
-        data["email"] = self.emails["existing"]
+        data = {**VALID_DATA, "email": EMAILS["existing"]}
 
         with pytest.raises(DuplicateEmailError) as exc_info:
             await self.user_repository.create_user(UserCreate(**data))
@@ -67,23 +56,44 @@ class TestUserRegistrationDuplication:
         assert str(exc_info.value) == "Email already exists"
 
     async def test_register_user_with_case_insensitive_duplicate_email(self):
-        data = self.get_valid_data()
-        data["email"] = self.emails["case_insensitive"]
+        data = {**VALID_DATA, "email": EMAILS["case_insensitive"]}
 
         with pytest.raises(DuplicateEmailError) as exc_info:
             await self.user_repository.create_user(UserCreate(**data))
 
         assert str(exc_info.value) == "Email already exists"
-
-    async def test_database_error_during_user_creation(self, db_session):
-        data = self.get_valid_data()
+        assert isinstance(exc_info.value.__context__, IntegrityError)
+
+    @pytest.mark.parametrize(
+        "error, expected_exc",
+        [
+            (
+                IntegrityError(
+                    "INSERT", {}, Exception("UNIQUE constraint failed: users.email")
+                ),
+                DuplicateEmailError,
+            ),
+            (
+                IntegrityError(
+                    "INSERT", {}, Exception("NOT NULL constraint failed: users.email")
+                ),
+                DatabaseError,
+            ),
+            (Exception("Error"), DatabaseError),
+        ],
+        ids=["unique_violation", "other_integrity_error", "generic_error"],
+    )
+    async def test_database_error_during_user_creation(
+        self, db_session, error, expected_exc
+    ):
+        data = VALID_DATA
 
         async def fake_commit():
-            raise Exception("Error")
+            raise error
 
         db_session.commit, original_commit = fake_commit, db_session.commit
 
-        with pytest.raises(DatabaseError):
+        with pytest.raises(expected_exc):
             await self.user_repository.create_user(UserCreate(**data))
 
         db_session.commit = original_commit
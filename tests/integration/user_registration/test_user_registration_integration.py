@@ -2,7 +2,6 @@ import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from app.models.user import User
 from app.core.security import verify_password
 import logging
 
@@ -15,12 +14,6 @@ logger = logging.getLogger(__name__)
 class TestUserRegistrationIntegration:
     REGISTER_URL = "/api/v1/users/register"
 
-    @pytest.fixture(autouse=True)
-    async def setup(self, db_session: AsyncSession):
-        # 테스트 전에 사용자 테이블을 비웁니다
-        await db_session.execute(User.__table__.delete())
-        await db_session.commit()
-
     async def test_user_registration_full_process(
         self, client: AsyncClient, db_session: AsyncSession
     ):
@@ -35,8 +28,8 @@ class TestUserRegistrationIntegration:
         response = await client.post(self.REGISTER_URL, json=user_data)
 
         # 로깅 추가
-        logger.info(f"Response status: {response.status_code}")
-        logger.info(f"Response content: {response.content}")
+        logger.info("Response status: %s", response.status_code)
+        logger.debug("Response content: %s", response.content)
 
         # 3. 응답 검증
         assert (
@@ -1,69 +1,59 @@
+from types import MappingProxyType
 import pytest
 from pydantic import ValidationError
 from app.schemas.user import UserLogin
 
-@pytest.mark.unit
-class TestUserLoginValidation:
-    @classmethod
-    def setup_class(cls):
-        cls.valid_data = {
-            "email": "test@example.com",
-            "password": "ValidPass1!",
-        }
-
-    @classmethod
-    def get_valid_data(cls):
-        return cls.valid_data.copy()
-
-    def test_valid_user_login(self):
-        user_login = UserLogin(**self.get_valid_data())
-        assert user_login.email == self.valid_data["email"]
-        assert user_login.password == self.valid_data["password"]
-
-    def test_email_invalid_format(self):
-        data = self.get_valid_data()
-        data["email"] = "invalid_email"
-        with pytest.raises(ValidationError, match="value is not a valid email address"):
-            UserLogin(**data)
-
-    def test_email_too_long(self):
-        data = self.get_valid_data()
-        data["email"] = "a" * 90 + "@example.com"
-        with pytest.raises(ValidationError):
-            UserLogin(**data)
 
-    def test_password_too_short(self):
-        data = self.get_valid_data()
-        data["password"] = "Short1!"
-        with pytest.raises(ValidationError):
-            UserLogin(**data)
+VALID_DATA = MappingProxyType(
+    {
+        "email": "test@example.com",
+        "password": "ValidPass1!",
+    }
+)
 
-    def test_password_too_long(self):
-        data = self.get_valid_data()
-        data["password"] = "A" * 21
-        with pytest.raises(ValidationError):
-            UserLogin(**data)
 
-    def test_email_field_empty(self):
-        data = self.get_valid_data()
-        data["email"] = ""
-        with pytest.raises(ValidationError, match="value is not a valid email address"):
-            UserLogin(**data)
-
-    def test_password_field_empty(self):
-        data = self.get_valid_data()
-        data["password"] = ""
-        with pytest.raises(ValidationError, match="String should have at least 8 characters"):
-            UserLogin(**data)
-
-    def test_email_whitespace_stripped(self):
-        data = self.get_valid_data()
-        data["email"] = " test@example.com "
-        user_login = UserLogin(**data)
-        assert user_login.email == "test@example.com"
-
-    def test_password_whitespace_stripped(self):
-        data = self.get_valid_data()
-        data["password"] = " ValidPass1! "
-        user_login = UserLogin(**data)
-        assert user_login.password == "ValidPass1!"
\ No newline at end of file
+@pytest.mark.unit
+class TestUserLoginValidation:
+    def test_valid_user_login(self):
+        user_login = UserLogin(**VALID_DATA)
+        assert user_login.email == VALID_DATA["email"]
+        assert user_login.password == VALID_DATA["password"]
+
+    @pytest.mark.parametrize(
+        "field, value, error_type",
+        [
+            ("email", "invalid_email", "value_error"),
+            ("email", "a" * 90 + "@example.com", "value_error"),
+            ("password", "Short1!", "string_too_short"),
+            ("password", "A" * 21, "string_too_long"),
+            ("email", "", "value_error"),
+            ("password", "", "string_too_short"),
+        ],
+        ids=[
+            "email_invalid_format",
+            "email_too_long",
+            "password_too_short",
+            "password_too_long",
+            "email_field_empty",
+            "password_field_empty",
+        ],
+    )
+    def test_invalid_field(self, field, value, error_type):
+        with pytest.raises(ValidationError) as exc_info:
+            UserLogin(**{**VALID_DATA, field: value})
+
+        (error,) = exc_info.value.errors()
+        assert error["loc"] == (field,)
+        assert error["type"] == error_type
+
+    @pytest.mark.parametrize(
+        "field, value, expected",
+        [
+            ("email", " test@example.com ", "test@example.com"),
+            ("password", " ValidPass1! ", "ValidPass1!"),
+        ],
+        ids=["email_whitespace_stripped", "password_whitespace_stripped"],
+    )
+    def test_valid_field_normalization(self, field, value, expected):
+        user_login = UserLogin(**{**VALID_DATA, field: value})
+        assert getattr(user_login, field) == expected
@@ -1,132 +1,104 @@
+import re
+from types import MappingProxyType
 import pytest
 from pydantic import ValidationError
 from app.schemas.user import UserCreate
 
 
-@pytest.mark.unit
-@pytest.mark.req_1_basic_user_registration
-class TestUserRegistrationValidation:
-    @classmethod
-    def setup_class(cls):
-        cls.valid_data = {
-            "email": "test@example.com",
-            "password": "ValidPass1!",
-            "name": "John Doe",
-        }
-
-    @classmethod
-    def get_valid_data(cls):
-        return cls.valid_data.copy()
-
-    def test_valid_user_creation(self):
-        user = UserCreate(**self.get_valid_data())
-        assert user.email == self.valid_data["email"]
-        assert user.password == self.valid_data["password"]
-        assert user.name == self.valid_data["name"]
-
-    def test_email_invalid_format(self):
-        data = self.get_valid_data()
-        data["email"] = "invalid_email"
-        with pytest.raises(
-            ValidationError, match="An email address must have an @-sign"
-        ):
-            UserCreate(**data)
-
-    def test_email_too_long(self):
-        data = self.get_valid_data()
-        data["email"] = "a" * 90 + "@example.com"
-        with pytest.raises(
-            ValidationError, match="The email address is too long before the @-sign"
-        ):
-            UserCreate(**data)
-
-    def test_password_too_short(self):
-        data = self.get_valid_data()
-        data["password"] = "Short1!"
-        with pytest.raises(
-            ValidationError, match="String should have at least 8 characters"
-        ):
-            UserCreate(**data)
-
-    def test_password_too_long(self):
-        data = self.get_valid_data()
-        data["password"] = "A" * 21
-        with pytest.raises(
-            ValidationError, match="String should have at most 20 characters"
-        ):
-            UserCreate(**data)
+VALID_DATA = MappingProxyType(
+    {
+        "email": "test@example.com",
+        "password": "ValidPass1!",
+        "name": "John Doe",
+    }
+)
 
-    def test_password_no_lowercase(self):
-        data = self.get_valid_data()
-        data["password"] = "UPPERCASE1!"
-        with pytest.raises(
-            ValidationError, match="Password must include at least one lowercase letter"
-        ):
-            UserCreate(**data)
 
-    def test_password_no_number(self):
-        data = self.get_valid_data()
-        data["password"] = "NoNumberPass!"
-        with pytest.raises(
-            ValidationError,
-            match="Password must include at least one lowercase letter, one number, and one special character",
-        ):
-            UserCreate(**data)
+# 커스텀 validator는 모두 value_error라서 메시지로 구분한다 (모듈 로드 시 한 번만 컴파일)
+EMAIL_NO_AT = re.compile("An email address must have an @-sign")
+EMAIL_TOO_LONG = re.compile("The email address is too long before the @-sign")
+PASSWORD_NO_LOWERCASE = re.compile("Password must include at least one lowercase letter")
+PASSWORD_COMPLEXITY = re.compile(
+    "Password must include at least one lowercase letter, one number, and one special character"
+)
+NAME_INVALID_CHAR = re.compile(
+    "Name can only contain alphabets, spaces, hyphens, and apostrophes"
+)
 
-    def test_password_no_special_char(self):
-        data = self.get_valid_data()
-        data["password"] = "NoSpecialChar1"
-        with pytest.raises(
-            ValidationError,
-            match="Password must include at least one lowercase letter, one number, and one special character",
-        ):
-            UserCreate(**data)
 
-    def test_name_valid_with_special_chars(self):
-        data = self.get_valid_data()
-        data["name"] = "Mary-Jane O'Connor"
-        user = UserCreate(**data)
-        assert user.name == "Mary-Jane O'Connor"
-
-    def test_name_too_short(self):
-        data = self.get_valid_data()
-        data["name"] = "A"
-        with pytest.raises(
-            ValidationError, match="String should have at least 2 characters"
-        ):
-            UserCreate(**data)
-
-    def test_name_too_long(self):
-        data = self.get_valid_data()
-        data["name"] = "A" * 51
-        with pytest.raises(
-            ValidationError, match="String should have at most 50 characters"
-        ):
-            UserCreate(**data)
-
-    def test_name_invalid_char(self):
-        data = self.get_valid_data()
-        data["name"] = "John123"
-        with pytest.raises(
-            ValidationError,
-            match="Name can only contain alphabets, spaces, hyphens, and apostrophes",
-        ):
-            UserCreate(**data)
-
-    def test_email_whitespace_stripped(self):
-        data = self.get_valid_data()
-        data["email"] = " test@example.com "
-        user = UserCreate(**data)
-        assert user.email == "test@example.com"
-
-    def test_password_whitespace_stripped(self):
-        data = self.get_valid_data()
-        data["password"] = " ValidPass1! "
-        user = UserCreate(**data)
-        assert user.password == "ValidPass1!"
-
-    def test_name_whitespace_compressed(self):
-        data = self.get_valid_data()
-        data["name"] = "John   Doe"
-        user = UserCreate(**data)
-        assert user.name == "John Doe"
+@pytest.mark.unit
+@pytest.mark.req_1_basic_user_registration
+class TestUserRegistrationValidation:
+    def test_valid_user_creation(self):
+        user = UserCreate(**VALID_DATA)
+        assert user.email == VALID_DATA["email"]
+        assert user.password == VALID_DATA["password"]
+        assert user.name == VALID_DATA["name"]
+
+    @pytest.mark.parametrize(
+        "field, value, error_type, message",
+        [
+            ("email", "invalid_email", "value_error", EMAIL_NO_AT),
+            ("email", "a" * 90 + "@example.com", "value_error", EMAIL_TOO_LONG),
+            ("password", "Short1!", "string_too_short", None),
+            ("password", "A" * 21, "string_too_long", None),
+            ("password", "UPPERCASE1!", "value_error", PASSWORD_NO_LOWERCASE),
+            ("password", "NoNumberPass!", "value_error", PASSWORD_COMPLEXITY),
+            # 메시지는 위 케이스에서 이미 검증하므로 에러 타입만 확인한다
+            ("password", "NoSpecialChar1", "value_error", None),
+            ("password", "onlylowercase", "value_error", None),
+            ("password", "ONLYUPPERCASE", "value_error", None),
+            ("name", "A", "string_too_short", None),
+            ("name", "A" * 51, "string_too_long", None),
+            ("name", "John123", "value_error", NAME_INVALID_CHAR),
+            ("name", "홍길동", "value_error", None),
+            # \s는 유니코드 공백도 매치하므로 isascii 검사로 거른다
+            ("name", "John\u00a0Doe", "value_error", NAME_INVALID_CHAR),
+            ("name", "John\u3000Doe", "value_error", NAME_INVALID_CHAR),
+        ],
+        ids=[
+            "email_invalid_format",
+            "email_too_long",
+            "password_too_short",
+            "password_too_long",
+            "password_no_lowercase",
+            "password_no_number",
+            "password_no_special_char",
+            "password_only_lowercase",
+            "password_only_uppercase",
+            "name_too_short",
+            "name_too_long",
+            "name_invalid_char",
+            "name_non_ascii",
+            "name_nbsp",
+            "name_ideographic_space",
+        ],
+    )
+    def test_invalid_field(self, field, value, error_type, message):
+        with pytest.raises(ValidationError) as exc_info:
+            UserCreate(**{**VALID_DATA, field: value})
+
+        (error,) = exc_info.value.errors()
+        assert error["loc"] == (field,)
+        assert error["type"] == error_type
+        if message is not None:
+            assert message.search(error["msg"])
+
+    @pytest.mark.parametrize(
+        "field, value, expected",
+        [
+            ("name", "Mary-Jane O'Connor", "Mary-Jane O'Connor"),
+            ("email", " test@example.com ", "test@example.com"),
+            ("password", " ValidPass1! ", "ValidPass1!"),
+            ("name", "John   Doe", "John Doe"),
+        ],
+        ids=[
+            "name_valid_with_special_chars",
+            "email_whitespace_stripped",
+            "password_whitespace_stripped",
+            "name_whitespace_compressed",
+        ],
+    )
+    def test_valid_field_normalization(self, field, value, expected):
+        user = UserCreate(**{**VALID_DATA, field: value})
+        assert getattr(user, field) == expected